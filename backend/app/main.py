@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from contextlib import asynccontextmanager
 from pydantic import BaseModel
 import uvicorn
 from typing import Optional, List
@@ -119,10 +120,30 @@ class SummaryProcessor:
 processor = SummaryProcessor(db_manager=db)
 logger.info("SummaryProcessor initialized with shared DatabaseManager.")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the database pools and sync env vars at startup, clean up on shutdown"""
+    logger.info("API starting up: opening database pools and synchronizing environment variables.")
+    await db.initialize()
+    try:
+        await db.sync_env_vars_to_db()
+        logger.info("Successfully synchronized environment variables to database.")
+    except Exception as e:
+        logger.error(f"Error during startup synchronization of environment variables: {str(e)}", exc_info=True)
+    yield
+    logger.info("API shutting down, cleaning up resources")
+    try:
+        processor.cleanup()
+        await db.close()
+        logger.info("Successfully cleaned up resources")
+    except Exception as e:
+        logger.error(f"Error during cleanup: {str(e)}", exc_info=True)
+
 app = FastAPI(
     title="Meeting Summarizer API",
     description="API for processing and summarizing meeting transcripts",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -182,8 +203,8 @@ class TranscriptRequest(BaseModel):
 async def get_meetings():
     """Get all meetings with their basic information"""
     try:
-        meetings = await db.get_all_meetings()
-        return [{"id": meeting["id"], "title": meeting["title"]} for meeting in meetings]
+        return [{"id": meeting["id"], "title": meeting["title"]}
+                async for meeting in db.get_all_meetings()]
     except Exception as e:
         logger.error(f"Error getting meetings: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -453,16 +474,11 @@ async def save_transcript(request: SaveTranscriptRequest):
         # Save the meeting
         await db.save_meeting(meeting_id, request.meeting_title)
 
-        # Save each transcript segment
-        for transcript in request.transcripts:
-            await db.save_meeting_transcript(
-                meeting_id=meeting_id,
-                transcript=transcript.text,
-                timestamp=transcript.timestamp,
-                summary="",
-                action_items="",
-                key_points=""
-            )
+        # Save all transcript segments in one batch (single commit)
+        await db.save_meeting_transcripts(
+            meeting_id,
+            [(transcript.text, transcript.timestamp) for transcript in request.transcripts]
+        )
 
         logger.info("Transcripts saved successfully")
         return {"status": "success", "message": "Transcript saved successfully", "meeting_id": meeting_id}
@@ -501,26 +517,6 @@ async def get_api_key(request: GetApiKeyRequest):
 
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Synchronize environment variables to DB on startup"""
-    logger.info("API starting up, attempting to synchronize environment variables to database.")
-    try:
-        await db.sync_env_vars_to_db()
-        logger.info("Successfully synchronized environment variables to database.")
-    except Exception as e:
-        logger.error(f"Error during startup synchronization of environment variables: {str(e)}", exc_info=True)
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on API shutdown"""
-    logger.info("API shutting down, cleaning up resources")
-    try:
-        processor.cleanup()
-        logger.info("Successfully cleaned up resources")
-    except Exception as e:
-        logger.error(f"Error during cleanup: {str(e)}", exc_info=True)
-
 if __name__ == "__main__":
     import multiprocessing
     multiprocessing.freeze_support()